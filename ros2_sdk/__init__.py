@@ -1 +1 @@
-from .ros2_sdk import ROS2SDK, TrajPoint
\ No newline at end of file
+from .ros2_sdk import ROS2SDK, TrajPoint, Subject, Subscription
\ No newline at end of file
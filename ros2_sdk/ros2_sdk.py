@@ -1,52 +1,297 @@
+import os
 import socket
+import sys
+import array
 import threading
-import msgpack
-from typing import List, Dict, Any, Optional
-from rx.subject import Subject
-from dataclasses import dataclass, field
-import zmq
-import platform
-
-@dataclass
-class TrajPoint:
+from collections import deque
+import msgspec
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pyzmq is imported lazily in connect() to keep importing the SDK cheap.
+    import zmq
+
+class TrajPoint(msgspec.Struct):
     """
     A trajectory point used for send_trajectory.
     The accelerations field is optional; if not provided, it defaults to an empty list.
+    As a msgspec Struct it is encoded directly by the C encoder, without building dicts.
+    It is not a dataclass: use msgspec.structs.replace / msgspec.structs.asdict instead
+    of dataclasses.replace / dataclasses.asdict.
     """
     positions: List[float]
     velocities: List[float]
     effort: List[float]
     seconds: int
     nanoseconds: int
-    accelerations: List[float] = field(default_factory=list)
+    accelerations: List[float] = msgspec.field(default_factory=list)
+
+class _IncomingMessage(msgspec.Struct):
+    """
+    Envelope of messages received from the ROS2 API. Only the fields the SDK reads
+    are declared, untyped so no message is rejected over them (e.g. a type of 1.0
+    still dispatches like 1); everything else, including name_publisher, is ignored.
+    """
+    type: Any = None
+    payload: Any = None
+
+class _Observer:
+    """Callbacks of one subscriber."""
+    __slots__ = ("on_next", "on_error")
+
+    def __init__(self, on_next: Callable[[Any], None], on_error: Optional[Callable[[Exception], None]]):
+        self.on_next = on_next
+        self.on_error = on_error
+
+class Subscription:
+    """Handle returned by Subject.subscribe(); call dispose() to unsubscribe."""
+    __slots__ = ("_subject", "_observer")
+
+    def __init__(self, subject: "Subject", observer: _Observer):
+        self._subject = subject
+        self._observer = observer
+
+    def dispose(self):
+        if self._subject is not None:
+            self._subject._unsubscribe(self._observer)
+            self._subject = None
+
+def _noop(value: Any):
+    pass
+
+class Subject:
+    """
+    Minimal stream used for the feedback and state streams: on_next calls every
+    subscriber with the value.
+    The observer list is replaced (never mutated) on subscribe/unsubscribe, so
+    on_next can iterate it without taking a lock.
+    """
+    def __init__(self):
+        self._observers: Tuple[_Observer, ...] = ()
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        observer: Any = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_completed: Optional[Callable[[], None]] = None,
+        on_next: Optional[Callable[[Any], None]] = None,
+        *,
+        scheduler: Any = None,
+    ) -> Subscription:
+        """
+        Same signature as rx's Observable.subscribe: pass an observer object with
+        on_next (and optionally on_error), or the callbacks positionally or by keyword.
+        If on_next raises, the exception is passed to that subscriber's on_error and
+        the subscriber is detached; without on_error it is printed.
+        The streams never complete, so on_completed is never called, and callbacks
+        always run on the SDK's dispatch thread, so scheduler is ignored.
+        """
+        if observer is not None:
+            if callable(getattr(observer, "on_next", None)):
+                on_next = observer.on_next
+                on_error = getattr(observer, "on_error", None)
+            else:
+                on_next = observer
+        entry = _Observer(on_next if on_next is not None else _noop, on_error)
+        with self._lock:
+            self._observers = self._observers + (entry,)
+        return Subscription(self, entry)
+
+    def _unsubscribe(self, observer: _Observer):
+        with self._lock:
+            observers = list(self._observers)
+            if observer in observers:
+                observers.remove(observer)
+                self._observers = tuple(observers)
+
+    def on_next(self, value: Any):
+        for observer in self._observers:
+            try:
+                observer.on_next(value)
+            except Exception as e:
+                if observer.on_error is None:
+                    print(e)
+                    continue
+                self._unsubscribe(observer)
+                try:
+                    observer.on_error(e)
+                except Exception as error_e:
+                    print(error_e)
+
+def _without_none_lists(trajPoints: List[TrajPoint]) -> List[TrajPoint]:
+    """
+    Returns the points with None joint value lists replaced by empty lists, so they
+    are sent as empty arrays. Affected points are copied; the caller's are untouched.
+    """
+    points = None
+    for i, tp in enumerate(trajPoints):
+        if tp.positions is None or tp.velocities is None or tp.effort is None or tp.accelerations is None:
+            if points is None:
+                points = list(trajPoints)
+            points[i] = msgspec.structs.replace(
+                tp,
+                positions=tp.positions if tp.positions is not None else [],
+                velocities=tp.velocities if tp.velocities is not None else [],
+                effort=tp.effort if tp.effort is not None else [],
+                accelerations=tp.accelerations if tp.accelerations is not None else [],
+            )
+    return trajPoints if points is None else points
+
+def _float64_view(values: Any) -> Optional[memoryview]:
+    """
+    Returns a memoryview if values is a flat, contiguous buffer of native float64
+    (array.array('d'), float64 numpy arrays), otherwise None.
+    """
+    if isinstance(values, (list, tuple)):
+        return None
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    native = "<d" if sys.byteorder == "little" else ">d"
+    if view.ndim == 1 and view.format in ("d", native) and view.c_contiguous:
+        return view
+    return None
+
+def _float64_bytes(values: Sequence[float]) -> bytes:
+    """
+    Returns the values as contiguous little-endian IEEE754 float64 bytes.
+    Buffers that already hold native float64 data are copied in one go;
+    anything else is converted first.
+    """
+    view = _float64_view(values)
+    if view is not None and sys.byteorder == "little":
+        return view.tobytes()
+    arr = array.array("d", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+def _map_header(size: int) -> bytes:
+    """msgpack fixmap header; all maps sent by the SDK have fewer than 16 entries."""
+    return bytes((0x80 | size,))
+
+def _command_prefix(msg_type: int, payload_keys: Tuple[str, ...]) -> Tuple[bytes, bytes]:
+    """
+    Pre-serializes the constant parts of a command message
+        {"type": msg_type, "name_publisher": <name>, "payload": {<payload_keys[0]>: <value>, ...}}
+    Returns the bytes before the name and the bytes between the name and the first
+    payload value. msgpack output is deterministic, so joining these with the encoded
+    name and values gives the same bytes as encoding the whole dict.
+    """
+    encode = msgspec.msgpack.encode
+    head = _map_header(3) + encode("type") + encode(msg_type) + encode("name_publisher")
+    body = encode("payload") + _map_header(len(payload_keys)) + encode(payload_keys[0])
+    return head, body
 
 class ROS2SDK:
+    # How long the receive thread waits for data before re-checking _running.
+    _POLL_TIMEOUT_MS = 100
+    # Default SO_SNDBUF/SO_RCVBUF for TCP connections.
+    _TCP_SOCKET_BUFFER_SIZE = 1 << 20
+    # Defaults for the send socket's high-water mark and linger period (ms).
+    _SEND_HWM = 100000
+    _SEND_LINGER_MS = 1000
+    # Incoming messages buffered for subscribers; the oldest are dropped on overflow.
+    _DISPATCH_QUEUE_SIZE = 1024
+    # Largest incoming message accepted by the receive socket.
+    _MAX_RECV_MESSAGE_SIZE = 16 * 1024 * 1024
+
     def __init__(self):
         # ZeroMQ specific attributes.
         self._zmq_context: Optional[zmq.Context] = None
         self._zmq_socket_recv: Optional[zmq.Socket] = None
         self._zmq_socket_send: Optional[zmq.Socket] = None        
+        self._poller: Optional[zmq.Poller] = None
         self._protocol: Optional[str] = None  # "TCP", "UDS", 0MQ
         
         self._endpoint_recv: Optional[str] = None
         self._endpoint_send: Optional[str] = None
 
         self._recv_thread: Optional[threading.Thread] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
         self._running: bool = False
+        # Optional CPU pinning / SCHED_FIFO priority for the receive thread (Linux only).
+        self._recv_affinity: Optional[int] = None
+        self._recv_priority: Optional[int] = None
+
+        # Messages are encoded outside of _send_lock with a per-thread msgspec encoder,
+        # so concurrent producers only serialize on the outbox and the socket send.
+        self._local: threading.local = threading.local()
+        self._decoder: msgspec.msgpack.Decoder = msgspec.msgpack.Decoder(_IncomingMessage)
+        self._send_lock: threading.Lock = threading.Lock()
+        # Packed messages queued with flush=False, sent on the next flush().
+        self._outbox: deque = deque()
+        # Pre-serialized constant parts of the command messages; only the name and
+        # the values are packed per call.
+        self._joint_prefixes: Dict[int, Tuple[bytes, bytes]] = {
+            msg_type: _command_prefix(msg_type, ("joint_values",)) for msg_type in (30, 31, 32)
+        }
+        self._joint_raw_prefixes: Dict[int, Tuple[bytes, bytes]] = {
+            msg_type: _command_prefix(msg_type, ("joint_values_raw",)) for msg_type in (30, 31, 32)
+        }
+        self._joypad_prefix: Tuple[bytes, bytes] = _command_prefix(50, ("buttons", "axes"))
+        self._axes_key: bytes = msgspec.msgpack.encode("axes")
+        self._trajectory_prefix: Tuple[bytes, bytes] = _command_prefix(20, ("joint_traj_points", "joint_names"))
+        self._joint_names_key: bytes = msgspec.msgpack.encode("joint_names")
 
         # Subjects for reactive streams.
         self._feedback_subject: Subject = Subject()
         self._state_subject: Subject = Subject()
+        # Incoming message type -> stream it is delivered to.
+        self._dispatch: Dict[int, Subject] = {
+            1: self._feedback_subject,  # feedback
+            2: self._state_subject,  # states
+        }
+        # (subject, payload) pairs handed from the receive thread to the dispatch thread.
+        self._dispatch_queue: deque = deque(maxlen=self._DISPATCH_QUEUE_SIZE)
+        self._dispatch_event: threading.Event = threading.Event()
 
     def connect(self, protocol: str, params: Dict[str, Any]):
         """
         Connects to the communication channel.
         For TCP, params should include: 'ip', 'port_recv', 'port_send'
         For UDS, params should include: 'path_recv', 'path_send'
+            (optional 'abstract': True to use Linux abstract socket names instead of files)
         For 0MQ, params should include: 'endpoint_recv', 'endpoint_send'
+        Optional for all protocols: 'sndbuf', 'rcvbuf' kernel socket buffer sizes in
+        bytes (TCP defaults to 1 MiB each, otherwise the OS default is kept).
+        Optional on Linux: 'recv_affinity' CPU core to pin the receive thread to, and
+        'recv_priority' SCHED_FIFO priority (1-99) for it. Real-time priority requires
+        root or CAP_SYS_NICE; if it cannot be applied, the thread keeps running unpinned.
+        Optional send socket tuning:
+            'sndhwm': messages queued before sends block (default 100000).
+            'linger': ms that messages still unsent at disconnect() keep being delivered
+                in the background before they are dropped (default 1000). disconnect()
+                itself never blocks on this.
+            'immediate': only queue messages once the peer is connected; sends block
+                until then (default False).
+            'conflate': keep only the latest unsent message. Only suitable when every
+                command is a "latest value" command (e.g. velocity or joypad streams),
+                since trajectories can be dropped as well (default False).
+        Optional 'io_threads': number of ZeroMQ I/O threads (default 1). The context is
+        shared process-wide, so this only takes effect on the first connect().
         """
+        recv_affinity = params.get("recv_affinity")
+        recv_priority = params.get("recv_priority")
+        if recv_affinity is not None:
+            if not hasattr(os, "sched_setaffinity"):
+                raise ValueError("'recv_affinity' is not supported on this platform.")
+            if not isinstance(recv_affinity, int) or isinstance(recv_affinity, bool):
+                raise ValueError("'recv_affinity' must be a CPU index (int).")
+            if recv_affinity not in os.sched_getaffinity(0):
+                raise ValueError(f"'recv_affinity' {recv_affinity} is not a CPU available to this process.")
+        if recv_priority is not None:
+            if not hasattr(os, "sched_setscheduler"):
+                raise ValueError("'recv_priority' is not supported on this platform.")
+            if not isinstance(recv_priority, int) or isinstance(recv_priority, bool) or not 1 <= recv_priority <= 99:
+                raise ValueError("'recv_priority' must be an int between 1 and 99.")
+        self._recv_affinity = recv_affinity
+        self._recv_priority = recv_priority
         self._protocol = protocol.upper()
-        self._zmq_context = zmq.Context()
+        sndbuf = params.get("sndbuf")
+        rcvbuf = params.get("rcvbuf")
 
         if self._protocol == "TCP":
             ip = params.get("ip")
@@ -58,16 +303,26 @@ class ROS2SDK:
                 raise ValueError("For TCP, 'port_recv' and 'port_send' must be provided in params.")
             self._endpoint_recv = f"tcp://{ip}:{port_recv}"
             self._endpoint_send = f"tcp://{ip}:{port_send}"
+            if sndbuf is None:
+                sndbuf = self._TCP_SOCKET_BUFFER_SIZE
+            if rcvbuf is None:
+                rcvbuf = self._TCP_SOCKET_BUFFER_SIZE
                         
         elif self._protocol == "UDS":
+            import platform
             if platform.system() == "Windows":
                 raise ValueError("UDS is not supported on Windows.")
             path_recv = params.get("path_recv")
             path_send = params.get("path_send")
             if path_recv is None or path_send is None:
                 raise ValueError("For UDS, 'path' must be provided in params.")
-            self._endpoint_recv = "ipc://" + path_recv
-            self._endpoint_send = "ipc://" + path_send
+            prefix = "ipc://"
+            if params.get("abstract", False):
+                if platform.system() != "Linux":
+                    raise ValueError("Abstract UDS names are only supported on Linux.")
+                prefix = "ipc://@"
+            self._endpoint_recv = prefix + path_recv
+            self._endpoint_send = prefix + path_send
             
         elif self._protocol == "0MQ":
             endpoint_recv = params.get("endpoint_recv")
@@ -81,19 +336,54 @@ class ROS2SDK:
         else:
             raise ValueError("Unsupported protocol. Use 'TCP', 'UDS' or 0MQ.")
 
+        import zmq
+        # Process-wide context, shared by all SDK instances.
+        self._zmq_context = zmq.Context.instance(io_threads=params.get("io_threads", 1))
         self._zmq_socket_recv = self._zmq_context.socket(zmq.PULL)
+        if rcvbuf is not None:
+            self._zmq_socket_recv.setsockopt(zmq.RCVBUF, rcvbuf)
+        self._zmq_socket_recv.setsockopt(zmq.MAXMSGSIZE, self._MAX_RECV_MESSAGE_SIZE)
         self._zmq_socket_recv.connect(self._endpoint_recv)
         self._zmq_socket_send = self._zmq_context.socket(zmq.PUSH)
+        if sndbuf is not None:
+            self._zmq_socket_send.setsockopt(zmq.SNDBUF, sndbuf)
+        self._zmq_socket_send.setsockopt(zmq.SNDHWM, params.get("sndhwm", self._SEND_HWM))
+        self._zmq_socket_send.setsockopt(zmq.LINGER, params.get("linger", self._SEND_LINGER_MS))
+        if params.get("immediate", False):
+            self._zmq_socket_send.setsockopt(zmq.IMMEDIATE, 1)
+        if params.get("conflate", False):
+            self._zmq_socket_send.setsockopt(zmq.CONFLATE, 1)
         self._zmq_socket_send.connect(self._endpoint_send)
+        self._poller = zmq.Poller()
+        self._poller.register(self._zmq_socket_recv, zmq.POLLIN)
         self._running = True
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatch_thread.start()
         self._recv_thread = threading.Thread(target=self._recv_loop, daemon=True)
         self._recv_thread.start()
 
     def disconnect(self):
-        """Closes the communication channel."""
+        """
+        Closes the communication channel. Queued messages are flushed to ZeroMQ first.
+        Closing the sockets does not block: ZeroMQ keeps delivering unsent messages in
+        the background for the linger period and drops whatever is left after it.
+        """
+        if self._zmq_socket_send:
+            try:
+                self.flush()
+            except Exception:
+                pass
+        self._outbox.clear()
         self._running = False
         if self._recv_thread:
             self._recv_thread.join()
+            self._recv_thread = None
+        self._dispatch_event.set()
+        if self._dispatch_thread:
+            self._dispatch_thread.join()
+            self._dispatch_thread = None
+        self._dispatch_queue.clear()
+        self._poller = None
         if self._zmq_socket_recv:
             try:
                 self._zmq_socket_recv.close()
@@ -106,32 +396,80 @@ class ROS2SDK:
             except Exception:
                 pass
             self._zmq_socket_send = None
-        if self._zmq_context:
-            self._zmq_context.term()
-            self._zmq_context = None
+        # The shared context stays alive for other SDK instances.
+        self._zmq_context = None
 
     def _recv_loop(self):
         """
         Background thread that waits for incoming messages.
-        When data is received, it is deserialized (with msgpack) and immediately pushed
-        to the proper stream based on its type.
+        The socket is polled with a short timeout so the loop notices disconnect(),
+        and every message already queued is drained in one wakeup. Frames are received
+        without copying and decoded straight from their buffer.
+        Each ZeroMQ message holds exactly one msgpack message; it is decoded (with
+        msgspec) and queued for the proper stream based on its type.
         """
-        unpacker = msgpack.Unpacker(raw=False)
+        import zmq
+        self._apply_recv_scheduling()
+        decode = self._decoder.decode
         while self._running:
             try:
-                data = self._zmq_socket_recv.recv()
-                if not data:
-                    break
-                unpacker.feed(data)
-                for msg in unpacker:
+                if not self._poller.poll(self._POLL_TIMEOUT_MS):
+                    continue
+                while True:
+                    try:
+                        frame = self._zmq_socket_recv.recv(zmq.NOBLOCK, copy=False)
+                    except zmq.Again:
+                        break
+                    data = frame.buffer
+                    if not data:
+                        return
+                    try:
+                        msg = decode(data)
+                    except msgspec.DecodeError as e:
+                        print(e)
+                        continue
                     self._handle_incoming_message(msg)
             except Exception as e:
                 print(e)
                 break
 
-    def _handle_incoming_message(self, msg: Dict[str, Any]):
+    def _dispatch_loop(self):
+        """
+        Background thread that delivers queued payloads to the subscribers, so slow
+        subscribers never hold up the receive thread. Exceptions from a subscriber
+        are handled per subscriber in Subject.on_next; this is only a safety net.
         """
-        Dispatches incoming messages to the proper Subject stream based on the message type.
+        queue = self._dispatch_queue
+        event = self._dispatch_event
+        while self._running:
+            event.wait()
+            event.clear()
+            while queue:
+                subject, payload = queue.popleft()
+                try:
+                    subject.on_next(payload)
+                except Exception as e:
+                    print(e)
+
+    def _apply_recv_scheduling(self):
+        """
+        Pins the calling (receive) thread and raises its priority if requested.
+        Failures are printed; they must not stop the receive thread.
+        """
+        if self._recv_affinity is not None:
+            try:
+                os.sched_setaffinity(0, {self._recv_affinity})
+            except (OSError, ValueError, OverflowError) as e:
+                print(e)
+        if self._recv_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self._recv_priority))
+            except (OSError, ValueError, OverflowError) as e:
+                print(e)
+
+    def _handle_incoming_message(self, msg: _IncomingMessage):
+        """
+        Queues incoming messages for the proper Subject stream based on the message type.
         Expected message structure:
             {
                 "type": int,  # feedback = 1, states = 2, calc_states = 10 
@@ -139,82 +477,118 @@ class ROS2SDK:
                 "payload": json
             }
         """
-        msg_type = msg.get("type")
-        if msg_type == 1:
-            # Feedback message
-            self._feedback_subject.on_next(msg["payload"])
-        elif msg_type == 2:
-            # State messages
-            self._state_subject.on_next(msg["payload"])
-        else:
+        try:
+            subject = self._dispatch.get(msg.type)
+        except TypeError:
+            # Unhashable type value (e.g. an array); cannot be a known type.
+            return
+        if subject is None:
             # Unknown type; optionally log or ignore.
-            pass
+            return
+        self._dispatch_queue.append((subject, msg.payload))
+        self._dispatch_event.set()
+
+    def _get_encoder(self) -> msgspec.msgpack.Encoder:
+        """Returns the calling thread's encoder, creating it on first use."""
+        try:
+            return self._local.encoder
+        except AttributeError:
+            encoder = self._local.encoder = msgspec.msgpack.Encoder()
+            return encoder
 
-    def _send_message(self, message: Dict[str, Any]):
+    def _send_packed(self, data: bytes, flush: bool):
         """
-        Serializes the given message with msgpack and sends it via the active channel.
+        Sends or queues already packed data. Must be called with _send_lock held.
+        The packed bytes are immutable, so large payloads are handed to ZeroMQ without
+        copying; pyzmq still copies small ones below its copy threshold.
+        With flush=False the packed message is only queued until the next flush().
+        """
+        if flush:
+            self._flush_outbox()
+            self._zmq_socket_send.send(data, copy=False, track=False)
+        else:
+            self._outbox.append(data)
+
+    def _send_joint_values(self, prefix: Tuple[bytes, bytes], values: Any, name: str, flush: bool):
+        """
+        Sends a joint command by joining its pre-serialized prefix with the encoded
+        name and values. Native float64 buffers (array.array('d'), float64 numpy
+        arrays) are accepted as well.
         """
-        data = msgpack.packb(message, use_bin_type=True)
         if not self._zmq_socket_send:
             raise RuntimeError("Not connected. Please call connect() first.")
-        self._zmq_socket_send.send(data)
-        
+        head, body = prefix
+        view = _float64_view(values)
+        encode = self._get_encoder().encode
+        encoded_values = encode(values) if view is None else encode(view.tolist())
+        data = b"".join((head, encode(name), body, encoded_values))
+        with self._send_lock:
+            self._send_packed(data, flush)
 
-    def send_velocity(self, vel: List[float], name: str):
-        payload = {"joint_values": vel}
-        message = {
-            "type": 31,
-            "name_publisher": name,
-            "payload": payload
-        }
-        self._send_message(message)
-
-    def send_position(self, pos: List[float], name: str):
-        payload = {"joint_values": pos}
-        message = {
-            "type": 30,
-            "name_publisher": name,
-            "payload": payload
-        }
-        self._send_message(message)
-
-    def send_effort(self, eff: List[float], name: str):
-        payload = {"joint_values": eff}
-        message = {
-            "type": 32,
-            "name_publisher": name,
-            "payload": payload
-        }
-        self._send_message(message)
-
-    def send_trajectory(self, trajPoints: List[TrajPoint], name: str, joint_names: List[str]):
-        joint_traj_points = []
-        for tp in trajPoints:
-            traj_dict = {
-                "positions": tp.positions if tp.positions else [],
-                "velocities": tp.velocities if tp.velocities else [],
-                "accelerations": tp.accelerations if tp.accelerations else [],
-                "effort": tp.effort if tp.effort else [],
-                "seconds": tp.seconds,
-                "nanoseconds": tp.nanoseconds
-            }
-            joint_traj_points.append(traj_dict)
-        payload = {"joint_traj_points": joint_traj_points, "joint_names": joint_names}
-        message = {
-            "type": 20,
-            "name_publisher": name,
-            "payload": payload
-        }
-        self._send_message(message)
-        
-    def send_joypad(self, buttons: List[int], axes: List[float], name: str):
-        payload = {"buttons": buttons, "axes": axes}
-        message = {
-            "type": 50,
-            "name_publisher": name,
-            "payload": payload
-        }
-        self._send_message(message)
+    def _flush_outbox(self):
+        """Sends all queued messages in order. Must be called with _send_lock held."""
+        outbox = self._outbox
+        send = self._zmq_socket_send.send
+        while outbox:
+            send(outbox.popleft(), copy=False, track=False)
+
+    def flush(self):
+        """
+        Sends all messages queued with flush=False back to back.
+        ZeroMQ's I/O thread coalesces them into as few socket writes as possible.
+        """
+        if not self._zmq_socket_send:
+            raise RuntimeError("Not connected. Please call connect() first.")
+        with self._send_lock:
+            self._flush_outbox()
+
+    def send_velocity(self, vel: List[float], name: str, flush: bool = True):
+        self._send_joint_values(self._joint_prefixes[31], vel, name, flush)
+
+    def send_position(self, pos: List[float], name: str, flush: bool = True):
+        self._send_joint_values(self._joint_prefixes[30], pos, name, flush)
+
+    def send_effort(self, eff: List[float], name: str, flush: bool = True):
+        self._send_joint_values(self._joint_prefixes[32], eff, name, flush)
+
+    def _send_joint_values_raw(self, msg_type: int, values: Sequence[float], name: str, flush: bool = True):
+        """
+        Sends joint values as a single msgpack bin blob of little-endian float64
+        under the "joint_values_raw" key. The receiving side must support this key.
+        """
+        self._send_joint_values(self._joint_raw_prefixes[msg_type], _float64_bytes(values), name, flush)
+
+    def send_velocity_raw(self, vel: Sequence[float], name: str, flush: bool = True):
+        self._send_joint_values_raw(31, vel, name, flush)
+
+    def send_position_raw(self, pos: Sequence[float], name: str, flush: bool = True):
+        self._send_joint_values_raw(30, pos, name, flush)
+
+    def send_effort_raw(self, eff: Sequence[float], name: str, flush: bool = True):
+        self._send_joint_values_raw(32, eff, name, flush)
+
+    def send_trajectory(self, trajPoints: List[TrajPoint], name: str, joint_names: List[str], flush: bool = True):
+        """
+        The trajectory points are msgspec Structs, so the whole list is encoded
+        in one C call without building intermediate dicts.
+        """
+        if not self._zmq_socket_send:
+            raise RuntimeError("Not connected. Please call connect() first.")
+        head, body = self._trajectory_prefix
+        encode = self._get_encoder().encode
+        points = _without_none_lists(trajPoints)
+        data = b"".join((head, encode(name), body, encode(points), self._joint_names_key, encode(joint_names)))
+        with self._send_lock:
+            self._send_packed(data, flush)
+
+    def send_joypad(self, buttons: List[int], axes: List[float], name: str, flush: bool = True):
+        if not self._zmq_socket_send:
+            raise RuntimeError("Not connected. Please call connect() first.")
+        head, body = self._joypad_prefix
+        encode = self._get_encoder().encode
+        data = b"".join((head, encode(name), body, encode(buttons), self._axes_key, encode(axes)))
+        with self._send_lock:
+            self._send_packed(data, flush)
 
     def get_feedback_stream(self) -> Subject:
         return self._feedback_subject
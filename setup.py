@@ -5,8 +5,7 @@ setup(
     version='0.1.0',
     packages=find_packages(),
     install_requires=[
-        'msgpack>=1.0.2',
-        'rx>=3.2.0',
+        'msgspec>=0.18.0',
         'pyzmq>=22.0.0',
     ],
     author='Johannes Mesner',